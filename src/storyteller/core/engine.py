@@ -69,7 +69,7 @@ class TextGenerator(Protocol):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationState:
     """
     Tracks the state of a story creation conversation.
@@ -342,7 +342,7 @@ class StoryEngine:
             character_details = format_character_details(
                 char.name,
                 char.description,
-                list(char.visual_traits),
+                char.visual_traits,
             )
         else:
             character_details = "Main character to be illustrated"
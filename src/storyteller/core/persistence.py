@@ -7,13 +7,15 @@ the project directory structure on disk.
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from .story import (
     Character,
     ConversationMessage,
@@ -42,10 +44,13 @@ def get_stories_directory() -> Path:
     return DEFAULT_STORIES_DIR
 
 
+@lru_cache(maxsize=256)
 def slugify(text: str) -> str:
     """
     Convert text to a filesystem-safe slug.
 
+    Results are cached; the function is pure.
+
     Args:
         text: The text to convert.
 
@@ -202,6 +207,41 @@ def dict_to_story(
     )
 
 
+def _encode_story(story: Story) -> bytes:
+    """Serialize a Story to indented UTF-8 JSON bytes."""
+    return orjson.dumps(story_to_dict(story), option=orjson.OPT_INDENT_2)
+
+
+def dumps_story(story: Story) -> str:
+    """
+    Serialize a Story to the JSON text stored in story.json.
+
+    Args:
+        story: The story to serialize.
+
+    Returns:
+        Indented JSON text.
+    """
+    return _encode_story(story).decode("utf-8")
+
+
+def loads_story(text: str | bytes, project_path: Path | None = None) -> Story:
+    """
+    Deserialize a Story from story.json text.
+
+    Args:
+        text: JSON text or UTF-8 bytes as produced by dumps_story.
+        project_path: The project directory path (for resolving illustration paths).
+
+    Returns:
+        A Story instance.
+
+    Raises:
+        json.JSONDecodeError: If the JSON is invalid.
+    """
+    return dict_to_story(orjson.loads(text), project_path)
+
+
 def create_project_directory(
     story: Story,
     base_dir: Path | None = None,
@@ -284,10 +324,7 @@ def save_story(
 
     # Serialize and write
     story_file = save_path / "story.json"
-    data = story_to_dict(story)
-
-    with open(story_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    story_file.write_bytes(_encode_story(story))
 
     logger.info("Saved story to: %s", story_file)
     return story
@@ -312,10 +349,7 @@ def load_story(project_path: Path) -> Story:
     if not story_file.exists():
         raise FileNotFoundError(f"No story.json found in {project_path}")
 
-    with open(story_file, encoding="utf-8") as f:
-        data = json.load(f)
-
-    story = dict_to_story(data, project_path)
+    story = loads_story(story_file.read_bytes(), project_path)
     logger.info("Loaded story from: %s", story_file)
     return story
 
@@ -347,11 +381,10 @@ def list_stories(base_dir: Path | None = None) -> list[tuple[Path, StoryMetadata
             continue
 
         try:
-            with open(story_file, encoding="utf-8") as f:
-                data = json.load(f)
+            data = orjson.loads(story_file.read_bytes())
             metadata = _dict_to_metadata(data["metadata"])
             stories.append((project_dir, metadata))
-        except (json.JSONDecodeError, KeyError) as e:
+        except (orjson.JSONDecodeError, KeyError) as e:
             logger.warning("Failed to load story from %s: %s", project_dir, e)
             continue
 
@@ -7,6 +7,7 @@ for representing stories, pages, and characters.
 
 from __future__ import annotations
 
+from bisect import insort
 from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
@@ -29,7 +30,7 @@ class ConversationMessage:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Character:
     """
     A character in the story with visual consistency traits.
@@ -83,10 +84,10 @@ class Character:
         Returns:
             True if the character's name appears in the text.
         """
-        return self.name.lower() in text.lower()
+        return self.name.casefold() in text.casefold()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Page:
     """
     A single page in the storybook.
@@ -125,7 +126,7 @@ class Page:
         return self.illustration_path is not None and self.illustration_path.exists()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StoryMetadata:
     """
     Metadata about a story project.
@@ -180,7 +181,7 @@ TARGET_AGE_RANGES: tuple[str, ...] = (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Story:
     """
     A complete story with all pages and characters.
@@ -198,6 +199,35 @@ class Story:
     pages: tuple[Page, ...] = field(default_factory=tuple)
     conversation: tuple[ConversationMessage, ...] = field(default_factory=tuple)
     project_path: Path | None = None
+    # Lookup indices, built on first use so intermediate copies never pay for them.
+    # Plain dicts, since a mappingproxy would stop the Story from being copied or pickled.
+    _page_index: dict[int, tuple[int, ...]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _char_index: dict[str, tuple[int, ...]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _page_positions(self, page_number: int) -> tuple[int, ...]:
+        """Return the indices of every page with this number, in order."""
+        page_index = self._page_index
+        if page_index is None:
+            page_index = {}
+            for i, page in enumerate(self.pages):
+                page_index[page.page_number] = page_index.get(page.page_number, ()) + (i,)
+            object.__setattr__(self, "_page_index", page_index)
+        return page_index.get(page_number, ())
+
+    def _character_positions(self, name: str) -> tuple[int, ...]:
+        """Return the indices of every character with this name (case-insensitive), in order."""
+        char_index = self._char_index
+        if char_index is None:
+            char_index = {}
+            for i, character in enumerate(self.characters):
+                key = character.name.casefold()
+                char_index[key] = char_index.get(key, ()) + (i,)
+            object.__setattr__(self, "_char_index", char_index)
+        return char_index.get(name.casefold(), ())
 
     @property
     def title(self) -> str:
@@ -219,10 +249,8 @@ class Story:
         Returns:
             The Page if found, None otherwise.
         """
-        for page in self.pages:
-            if page.page_number == page_number:
-                return page
-        return None
+        positions = self._page_positions(page_number)
+        return self.pages[positions[0]] if positions else None
 
     def get_character(self, name: str) -> Character | None:
         """
@@ -234,11 +262,8 @@ class Story:
         Returns:
             The Character if found, None otherwise.
         """
-        name_lower = name.lower()
-        for character in self.characters:
-            if character.name.lower() == name_lower:
-                return character
-        return None
+        positions = self._character_positions(name)
+        return self.characters[positions[0]] if positions else None
 
     def with_metadata(self, **kwargs: Any) -> Story:
         """
@@ -316,13 +341,18 @@ def remove_character(story: Story, name: str) -> Story:
 
     Args:
         story: The original story.
-        name: The name of the character to remove (case-insensitive).
+        name: The name of the character to remove (case-insensitive). Every
+            character with that name is removed.
 
     Returns:
         A new Story with the character removed.
     """
-    name_lower = name.lower()
-    new_characters = tuple(c for c in story.characters if c.name.lower() != name_lower)
+    positions = story._character_positions(name)
+    new_characters = (
+        tuple(c for i, c in enumerate(story.characters) if i not in positions)
+        if positions
+        else story.characters
+    )
     return replace(
         story,
         characters=new_characters,
@@ -345,8 +375,7 @@ def add_page(story: Story, page: Page) -> Story:
         A new Story with the page added.
     """
     pages = list(story.pages)
-    pages.append(page)
-    pages.sort(key=lambda p: p.page_number)
+    insort(pages, page, key=lambda p: p.page_number)
     return replace(
         story,
         pages=tuple(pages),
@@ -358,6 +387,8 @@ def update_page(story: Story, page_number: int, **kwargs: Any) -> Story:
     """
     Return a new Story with the specified page updated.
 
+    If several pages share the number, all of them are updated.
+
     Args:
         story: The original story.
         page_number: The page number to update.
@@ -369,22 +400,16 @@ def update_page(story: Story, page_number: int, **kwargs: Any) -> Story:
     Raises:
         ValueError: If the page number is not found.
     """
-    new_pages: list[Page] = []
-    found = False
-
-    for page in story.pages:
-        if page.page_number == page_number:
-            new_pages.append(page.with_updates(**kwargs))
-            found = True
-        else:
-            new_pages.append(page)
-
-    if not found:
+    positions = story._page_positions(page_number)
+    if not positions:
         raise ValueError(f"Page {page_number} not found in story")
 
+    pages = list(story.pages)
+    for index in positions:
+        pages[index] = pages[index].with_updates(**kwargs)
     return replace(
         story,
-        pages=tuple(new_pages),
+        pages=tuple(pages),
         metadata=story.metadata.with_updates(),
     )
 
@@ -393,7 +418,8 @@ def remove_page(story: Story, page_number: int) -> Story:
     """
     Return a new Story with the specified page removed.
 
-    Note: This does not renumber remaining pages.
+    All pages with that number are removed. Note: This does not renumber
+    remaining pages.
 
     Args:
         story: The original story.
@@ -402,7 +428,12 @@ def remove_page(story: Story, page_number: int) -> Story:
     Returns:
         A new Story with the page removed.
     """
-    new_pages = tuple(p for p in story.pages if p.page_number != page_number)
+    positions = story._page_positions(page_number)
+    new_pages = (
+        tuple(page for i, page in enumerate(story.pages) if i not in positions)
+        if positions
+        else story.pages
+    )
     return replace(
         story,
         pages=new_pages,
@@ -422,7 +453,10 @@ def renumber_pages(story: Story) -> Story:
     Returns:
         A new Story with pages renumbered 1, 2, 3, etc.
     """
-    new_pages = tuple(replace(page, page_number=i + 1) for i, page in enumerate(story.pages))
+    new_pages = tuple(
+        page if page.page_number == number else replace(page, page_number=number)
+        for number, page in enumerate(story.pages, start=1)
+    )
     return replace(
         story,
         pages=new_pages,
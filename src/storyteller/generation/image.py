@@ -12,12 +12,15 @@ Requirements:
 from __future__ import annotations
 
 import logging
+import random
 import sys
 import threading
 import time
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable
+from types import MappingProxyType
+from typing import Callable, ClassVar
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +28,23 @@ logger = logging.getLogger(__name__)
 MAX_SEED = 2147483647  # Maximum value for 32-bit signed integer seed
 
 
-@dataclass(frozen=True)
+def _forbidden_prefixes(directories: Iterable[str]) -> tuple[Path, ...]:
+    """Return each directory both as given and resolved, without duplicates.
+
+    Output paths are resolved before the check, so symlinked system directories
+    (e.g. /etc -> /private/etc on macOS) must be matched by their real location.
+    """
+    paths = (Path(directory) for directory in directories)
+    return tuple(dict.fromkeys(p for path in paths for p in (path, path.resolve())))
+
+
+# System directories generated images must never be written into
+_FORBIDDEN_PREFIXES = _forbidden_prefixes(
+    ("/etc", "/var", "/usr", "/bin", "/sbin", "/root", "/sys", "/proc")
+)
+
+
+@dataclass(frozen=True, slots=True)
 class ImageConfig:
     """Configuration for image generation.
 
@@ -45,16 +64,23 @@ class ImageConfig:
     height: int = 1024
     seed: int | None = None
 
+    _VALID_MODELS: ClassVar[frozenset[str]] = frozenset(("schnell", "dev"))
+    _VALID_QUANTIZE: ClassVar[frozenset[int]] = frozenset((4, 8))
+    _STEP_RANGES: ClassVar[Mapping[str, tuple[int, int]]] = MappingProxyType(
+        {"schnell": (2, 8), "dev": (15, 30)}
+    )
+
     def __post_init__(self) -> None:
         """Validate configuration values."""
-        if self.model not in ("schnell", "dev"):
+        if self.model not in self._VALID_MODELS:
             raise ValueError(f"Invalid model: {self.model}. Must be 'schnell' or 'dev'.")
-        if self.quantize not in (4, 8):
+        if self.quantize not in self._VALID_QUANTIZE:
             raise ValueError(f"Invalid quantize: {self.quantize}. Must be 4 or 8.")
-        if self.model == "schnell" and not (2 <= self.steps <= 8):
-            raise ValueError(f"Invalid steps for schnell: {self.steps}. Must be 2-8.")
-        if self.model == "dev" and not (15 <= self.steps <= 30):
-            raise ValueError(f"Invalid steps for dev: {self.steps}. Must be 15-30.")
+        low, high = self._STEP_RANGES[self.model]
+        if not (low <= self.steps <= high):
+            raise ValueError(
+                f"Invalid steps for {self.model}: {self.steps}. Must be {low}-{high}."
+            )
 
     @classmethod
     def for_model(cls, model: str, quantize: int = 4) -> ImageConfig:
@@ -311,7 +337,7 @@ class ImageGenerator:
         # Determine seed
         seed = self._config.seed
         if seed is None:
-            seed = int(time.time() * 1000) % MAX_SEED
+            seed = random.randrange(MAX_SEED)
 
         if progress_callback:
             progress_callback(GenerationProgress(
@@ -360,16 +386,13 @@ class ImageGenerator:
         # Check for path traversal attempts (e.g., ../../../etc/passwd)
         # The path must be within a reasonable project directory
         # We check that the path doesn't escape to system directories
-        forbidden_prefixes = ("/etc", "/var", "/usr", "/bin", "/sbin", "/root", "/sys", "/proc")
-        path_str = str(resolved_path)
-        for forbidden in forbidden_prefixes:
-            if path_str.startswith(forbidden):
-                logger.error(f"Path traversal attempt detected: {output_path}")
-                return GenerationResult(
-                    success=False,
-                    error=f"Invalid output path: cannot write to system directory",
-                    generation_time=time.time() - start_time,
-                )
+        if any(resolved_path.is_relative_to(forbidden) for forbidden in _FORBIDDEN_PREFIXES):
+            logger.error(f"Path traversal attempt detected: {output_path}")
+            return GenerationResult(
+                success=False,
+                error=f"Invalid output path: cannot write to system directory",
+                generation_time=time.time() - start_time,
+            )
 
         # Ensure output directory exists
         resolved_path.parent.mkdir(parents=True, exist_ok=True)
@@ -433,16 +456,19 @@ def get_generator(config: ImageConfig | None = None) -> ImageGenerator:
     """
     global _default_generator
 
-    # Double-checked locking pattern for thread-safe singleton
-    if _default_generator is None:
+    # Double-checked locking pattern for thread-safe singleton. The global is
+    # read once into a local so a concurrent reset can't make us return None.
+    generator = _default_generator
+    if generator is None:
         with _singleton_lock:
             # Check again inside the lock
-            if _default_generator is None:
-                _default_generator = ImageGenerator(config)
+            generator = _default_generator
+            if generator is None:
+                generator = _default_generator = ImageGenerator(config)
     elif config is not None:
-        _default_generator.update_config(config)
+        generator.update_config(config)
 
-    return _default_generator
+    return generator
 
 
 def generate_image(
@@ -8,15 +8,19 @@ Templates are designed to be modular and easily adjustable for experimentation.
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
-from string import Template
-from typing import Any
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, ClassVar
+
+from .styles import apply_style, get_style
 
 # Constants
 MAX_SCENE_LENGTH = 200  # Maximum length for scene description in prompts
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PromptTemplate:
     """
     A configurable prompt template.
@@ -30,18 +34,115 @@ class PromptTemplate:
     name: str
     template: str
     description: str = ""
+    _segments: tuple[tuple[str, str, str], ...] = field(init=False, repr=False, compare=False)
+    _tail: str = field(init=False, repr=False, compare=False)
+
+    # Same placeholder syntax as string.Template: "$$", "$name" and "${name}".
+    # A "$" that starts none of these is left as literal text.
+    _PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"\$(?:(?P<escaped>\$)"
+        r"|(?P<named>[_a-zA-Z][_a-zA-Z0-9]*)"
+        r"|\{(?P<braced>[_a-zA-Z][_a-zA-Z0-9]*)\})"
+    )
+
+    def __post_init__(self) -> None:
+        """Parse the template once instead of on every render."""
+        segments, tail = self._parse(self.template)
+        object.__setattr__(self, "_segments", segments)
+        object.__setattr__(self, "_tail", tail)
 
     def render(self, **kwargs: Any) -> str:
         """
         Render the template with the given variables.
 
+        Missing variables are left in place, as string.Template.safe_substitute does.
+
         Args:
             **kwargs: Variables to substitute in the template.
 
         Returns:
             The rendered prompt string.
         """
-        return Template(self.template).safe_substitute(**kwargs)
+        get = kwargs.get
+        parts: list[str] = []
+        append = parts.append
+        for literal, name, placeholder in self._segments:
+            append(literal)
+            append(str(get(name, placeholder)))
+        append(self._tail)
+        return "".join(parts)
+
+    def partial(self, **constants: Any) -> PromptTemplate:
+        """
+        Bake some variables into a new template, leaving the rest as placeholders.
+
+        Useful when most variables stay the same across many renders (e.g. the
+        story title for every page), so only the varying ones are passed later.
+
+        Args:
+            **constants: Variables to substitute now.
+
+        Returns:
+            A new PromptTemplate with the same name and description.
+        """
+        parts: list[str] = []
+        pending: list[str] = []  # literal text and baked values since the last kept placeholder
+        for literal, name, placeholder in self._segments:
+            pending.append(literal)
+            if name in constants:
+                pending.append(str(constants[name]))
+            else:
+                self._append_literal(parts, "".join(pending))
+                parts.append(placeholder)
+                pending = []
+        pending.append(self._tail)
+        self._append_literal(parts, "".join(pending))
+        return PromptTemplate(self.name, "".join(parts), self.description)
+
+    @staticmethod
+    def _append_literal(parts: list[str], text: str) -> None:
+        """
+        Append text to a partial template, escaped so it is never read as a placeholder.
+
+        If parts ends with a bare "$name" that the text would run into, the
+        placeholder is braced first.
+
+        Args:
+            parts: The template pieces so far; a non-empty list ends with a placeholder.
+            text: The literal text to append.
+        """
+        if text and parts and parts[-1][1] != "{":
+            first = text[0]
+            if first == "_" or (first.isascii() and first.isalnum()):
+                parts[-1] = f"${{{parts[-1][1:]}}}"
+        parts.append(text.replace("$", "$$"))
+
+    @classmethod
+    def _parse(cls, text: str) -> tuple[tuple[tuple[str, str, str], ...], str]:
+        """
+        Split a template string into literal text and variable references.
+
+        Args:
+            text: The template string.
+
+        Returns:
+            A tuple of (literal_before, name, original_placeholder) segments, and
+            the literal text after the last placeholder.
+        """
+        segments: list[tuple[str, str, str]] = []
+        literal: list[str] = []
+        position = 0
+        for match in cls._PATTERN.finditer(text):
+            literal.append(text[position : match.start()])
+            name = match.group("named") or match.group("braced")
+            if name is not None:
+                segments.append(("".join(literal), name, match.group()))
+                literal = []
+            else:
+                literal.append("$")  # "$$" renders as a single "$"
+            position = match.end()
+        literal.append(text[position:])
+        return tuple(segments), "".join(literal)
 
 
 # =============================================================================
@@ -327,14 +428,8 @@ Respond with ONLY the character lines, nothing else. If no characters are found,
 # Utility Functions
 # =============================================================================
 
-def get_all_templates() -> dict[str, PromptTemplate]:
-    """
-    Get all defined prompt templates.
-
-    Returns:
-        Dictionary mapping template names to PromptTemplate objects.
-    """
-    return {
+_ALL_TEMPLATES: Mapping[str, PromptTemplate] = MappingProxyType(
+    {
         "story_guide_system": STORY_GUIDE_SYSTEM,
         "page_writer_system": PAGE_WRITER_SYSTEM,
         "illustration_prompt_system": ILLUSTRATION_PROMPT_SYSTEM,
@@ -348,6 +443,19 @@ def get_all_templates() -> dict[str, PromptTemplate]:
         "define_character": DEFINE_CHARACTER,
         "extract_visual_traits": EXTRACT_VISUAL_TRAITS,
     }
+)
+
+
+def get_all_templates() -> Mapping[str, PromptTemplate]:
+    """
+    Get all defined prompt templates.
+
+    Returns:
+        Read-only mapping of template names to PromptTemplate objects.
+        The same mapping is returned on every call; copy it with dict()
+        if you need to modify it.
+    """
+    return _ALL_TEMPLATES
 
 
 def format_previous_pages(pages: list[tuple[int, str]]) -> str:
@@ -362,17 +470,13 @@ def format_previous_pages(pages: list[tuple[int, str]]) -> str:
     """
     if not pages:
         return "(This is the first page)"
-
-    lines = []
-    for num, text in pages:
-        lines.append(f"Page {num}: {text}")
-    return "\n".join(lines)
+    return "\n".join([f"Page {num}: {text}" for num, text in pages])
 
 
 def format_character_details(
     name: str,
     description: str,
-    visual_traits: list[str],
+    visual_traits: Sequence[str],
 ) -> str:
     """
     Format character details for prompts.
@@ -380,34 +484,33 @@ def format_character_details(
     Args:
         name: Character name.
         description: Character description.
-        visual_traits: List of visual traits.
+        visual_traits: Sequence of visual traits.
 
     Returns:
         Formatted character details string.
     """
-    traits_str = ", ".join(visual_traits) if visual_traits else "not specified"
-    return f"{name}: {description}\nVisual traits: {traits_str}"
+    return _format_character_details(name, description, tuple(visual_traits))
 
 
-def calculate_story_structure(page_count: int) -> dict[str, int]:
-    """
-    Calculate story structure based on page count.
+@lru_cache(maxsize=128)
+def _format_character_details(name: str, description: str, visual_traits: tuple[str, ...]) -> str:
+    """Cached worker for format_character_details, keyed on hashable arguments."""
+    traits_str = ", ".join(visual_traits) if visual_traits else "not specified"
+    return f"{name}: {description}\nVisual traits: {traits_str}"
 
-    Args:
-        page_count: Total number of pages.
 
-    Returns:
-        Dictionary with beginning_end, middle_start, middle_end, ending_start.
-    """
+@lru_cache(maxsize=64)
+def _compute_story_structure(page_count: int) -> Mapping[str, int]:
+    """Compute the beginning/middle/ending page boundaries for a page count, memoized."""
     if page_count <= 4:
-        return {
+        structure = {
             "beginning_end": 1,
             "middle_start": 2,
             "middle_end": page_count - 1,
             "ending_start": page_count,
         }
     elif page_count <= 8:
-        return {
+        structure = {
             "beginning_end": 2,
             "middle_start": 3,
             "middle_end": page_count - 2,
@@ -416,12 +519,26 @@ def calculate_story_structure(page_count: int) -> dict[str, int]:
     else:
         beginning = page_count // 4
         ending_start = page_count - (page_count // 4) + 1
-        return {
+        structure = {
             "beginning_end": beginning,
             "middle_start": beginning + 1,
             "middle_end": ending_start - 1,
             "ending_start": ending_start,
         }
+    return MappingProxyType(structure)
+
+
+def calculate_story_structure(page_count: int) -> Mapping[str, int]:
+    """
+    Calculate story structure based on page count.
+
+    Args:
+        page_count: Total number of pages.
+
+    Returns:
+        Read-only mapping with beginning_end, middle_start, middle_end, ending_start.
+    """
+    return _compute_story_structure(page_count)
 
 
 # =============================================================================
@@ -431,7 +548,7 @@ def calculate_story_structure(page_count: int) -> dict[str, int]:
 
 def build_illustration_prompt_simple(
     page_text: str,
-    characters: list[tuple[str, str, list[str]]] | None = None,
+    characters: Sequence[tuple[str, str, Sequence[str]]] | None = None,
     style: str = "watercolor",
     setting: str = "",
     mood: str = "warm and friendly",
@@ -460,17 +577,14 @@ def build_illustration_prompt_simple(
         ...     style="watercolor",
         ... )
     """
-    from storyteller.generation.styles import apply_style
-
     # Validate style early to catch invalid styles before processing
-    from storyteller.generation.styles import get_style
     get_style(style)  # Raises KeyError if style is invalid
 
-    # Start with the scene description based on page text
-    # Strip the text to use as scene context
+    # Start with the scene description based on page text, truncated with an
+    # ellipsis so the result never exceeds MAX_SCENE_LENGTH
     scene = page_text.strip()
     if len(scene) > MAX_SCENE_LENGTH:
-        scene = scene[:MAX_SCENE_LENGTH - 3] + "..."
+        scene = scene[: MAX_SCENE_LENGTH - 3] + "..."
 
     parts = [f"Scene: {scene}"]
 
@@ -500,6 +614,39 @@ def build_illustration_prompt_simple(
     return apply_style(base_prompt, style)
 
 
+@lru_cache(maxsize=64)
+def _compile_name_pattern(
+    names: tuple[str, ...],
+) -> tuple[re.Pattern[str], tuple[str, ...], frozenset[str]]:
+    """
+    Compile one pattern that finds every whole-word occurrence of any of the names.
+
+    The alternation sits inside a lookahead so matches never consume text, and
+    a name embedded in another (e.g. "Owl" in "Mr. Owl") is still found at its
+    own position. Names are tried longest first. When two names match at the
+    same position, only the longer one is reported; a name that is a prefix of
+    another name can therefore hide behind it and is returned in ``shadowed``
+    for an individual check.
+
+    Args:
+        names: The character names to search for.
+
+    Returns:
+        The compiled pattern, the names in group order (group i + 1 is
+        ordered[i]), and the set of names that need an individual search.
+    """
+    ordered = tuple(sorted(set(names), key=len, reverse=True))
+    alternatives = "|".join(f"({re.escape(name)})" for name in ordered)
+    pattern = re.compile(rf"(?=\b(?:{alternatives})\b)", re.IGNORECASE)
+    folded = [name.casefold() for name in ordered]
+    shadowed = frozenset(
+        name
+        for i, (name, fold) in enumerate(zip(ordered, folded, strict=True))
+        if any(j != i and other.startswith(fold) for j, other in enumerate(folded))
+    )
+    return pattern, ordered, shadowed
+
+
 def find_characters_in_page(
     page_text: str,
     all_characters: list[tuple[str, str, tuple[str, ...]]],
@@ -509,6 +656,7 @@ def find_characters_in_page(
 
     Uses word boundary matching to avoid false positives where a character
     name is a substring of another word (e.g., "Art" matching "Arthur" or "party").
+    All names are found in a single scan of the text.
 
     Args:
         page_text: The text content of the page.
@@ -518,17 +666,39 @@ def find_characters_in_page(
     Returns:
         List of characters that appear in this page.
     """
-    appearing = []
+    return [
+        (name, description, list(traits))
+        for name, description, traits in _characters_in_page(page_text, all_characters)
+    ]
+
+
+def _characters_in_page(
+    page_text: str,
+    all_characters: list[tuple[str, str, tuple[str, ...]]],
+) -> list[tuple[str, str, tuple[str, ...]]]:
+    """Return the entries of all_characters whose names appear in the page, uncopied."""
+    if not all_characters:
+        return []
+
+    found = _names_in_page(
+        tuple(name for name, _description, _traits in all_characters), page_text
+    )
+    return [character for character in all_characters if character[0] in found]
 
-    for name, description, traits in all_characters:
-        # Use word boundary regex to match whole words only
-        # re.escape handles special characters in names
-        # \b matches word boundaries (start/end of word)
-        pattern = r'\b' + re.escape(name) + r'\b'
-        if re.search(pattern, page_text, re.IGNORECASE):
-            appearing.append((name, description, list(traits)))
 
-    return appearing
+@lru_cache(maxsize=256)
+def _names_in_page(names: tuple[str, ...], page_text: str) -> frozenset[str]:
+    """Return the names that appear in the page, cached for retried or re-shown pages."""
+    pattern, ordered, shadowed = _compile_name_pattern(names)
+    found: set[str] = set()
+    for match in pattern.finditer(page_text):
+        index = match.lastindex
+        if index is not None:  # always set: every alternative is a capturing group
+            found.add(ordered[index - 1])
+    for name in shadowed - found:
+        if re.search(r"\b" + re.escape(name) + r"\b", page_text, re.IGNORECASE):
+            found.add(name)
+    return frozenset(found)
 
 
 def build_illustration_prompt_for_page(
@@ -552,8 +722,9 @@ def build_illustration_prompt_for_page(
     Returns:
         A complete prompt ready for image generation.
     """
-    # Find which characters appear on this page
-    characters = find_characters_in_page(page_text, all_characters)
+    # Find which characters appear on this page; the traits tuples are only
+    # joined, so they don't need the list copies find_characters_in_page makes
+    characters = _characters_in_page(page_text, all_characters)
 
     return build_illustration_prompt_simple(
         page_text=page_text,
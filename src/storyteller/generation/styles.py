@@ -6,10 +6,12 @@ to achieve consistent illustration styles for children's books.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StylePreset:
     """An illustration style preset.
 
@@ -35,8 +37,11 @@ SAFETY_MODIFIERS = (
     "warm colors, gentle and safe feeling, age-appropriate"
 )
 
+# The functions that append SAFETY_MODIFIERS, as listed in the comment above
+_SAFETY_APPLIED_BY: tuple[str, ...] = ("apply_style", "build_illustration_prompt")
 
-STYLE_PRESETS: dict[str, StylePreset] = {
+
+STYLE_PRESETS: Mapping[str, StylePreset] = MappingProxyType({
     "watercolor": StylePreset(
         name="watercolor",
         display_name="Watercolor",
@@ -85,7 +90,17 @@ STYLE_PRESETS: dict[str, StylePreset] = {
         ),
         description="Hand-drawn pencil sketch with soft shading",
     ),
-}
+})
+
+_ALL_STYLES: tuple[StylePreset, ...] = tuple(STYLE_PRESETS.values())
+
+# Preset names for the "Unknown style" error message
+_STYLE_NAMES = ", ".join(STYLE_PRESETS)
+
+# Style suffix plus safety modifiers for each preset, assembled once
+_APPLIED_SUFFIX: Mapping[str, str] = MappingProxyType({
+    name: f", {preset.prompt_suffix}, {SAFETY_MODIFIERS}" for name, preset in STYLE_PRESETS.items()
+})
 
 
 def get_style(name: str) -> StylePreset:
@@ -100,10 +115,10 @@ def get_style(name: str) -> StylePreset:
     Raises:
         KeyError: If the style name is not found.
     """
-    if name not in STYLE_PRESETS:
-        available = ", ".join(STYLE_PRESETS.keys())
-        raise KeyError(f"Unknown style '{name}'. Available: {available}")
-    return STYLE_PRESETS[name]
+    try:
+        return STYLE_PRESETS[name]
+    except KeyError:
+        raise KeyError(f"Unknown style '{name}'. Available: {_STYLE_NAMES}") from None
 
 
 def list_styles() -> list[StylePreset]:
@@ -112,7 +127,7 @@ def list_styles() -> list[StylePreset]:
     Returns:
         List of all StylePreset objects.
     """
-    return list(STYLE_PRESETS.values())
+    return list(_ALL_STYLES)
 
 
 def apply_style(base_prompt: str, style_name: str) -> str:
@@ -132,12 +147,14 @@ def apply_style(base_prompt: str, style_name: str) -> str:
         >>> apply_style("A mouse in a garden", "watercolor")
         'A mouse in a garden, watercolor illustration style, ...'
     """
-    style = get_style(style_name)
+    try:
+        suffix = _APPLIED_SUFFIX[style_name]
+    except KeyError:
+        get_style(style_name)  # Raises KeyError listing the available styles
+        raise
 
     # Combine base prompt with style and safety modifiers
-    full_prompt = f"{base_prompt}, {style.prompt_suffix}, {SAFETY_MODIFIERS}"
-
-    return full_prompt
+    return base_prompt + suffix
 
 
 def build_illustration_prompt(
@@ -168,19 +185,15 @@ def build_illustration_prompt(
         ...     style_name="watercolor",
         ... )
     """
-    parts = [scene_description]
+    base_prompt = scene_description
 
     # Add character traits if present
     if character_traits:
-        traits_str = ", ".join(character_traits)
-        parts.append(f"featuring {traits_str}")
+        base_prompt = f"{base_prompt}, featuring {', '.join(character_traits)}"
 
     # Add additional context if present
     if additional_context:
-        parts.append(additional_context)
-
-    # Combine parts
-    base_prompt = ", ".join(parts)
+        base_prompt = f"{base_prompt}, {additional_context}"
 
     # Apply style and safety modifiers
     return apply_style(base_prompt, style_name)
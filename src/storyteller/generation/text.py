@@ -8,13 +8,13 @@ allowing easy swapping of models and backends.
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Protocol, runtime_checkable
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Message:
     """
     A single message in a conversation.
@@ -28,7 +28,7 @@ class Message:
     content: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GenerationConfig:
     """
     Configuration for text generation.
@@ -43,7 +43,7 @@ class GenerationConfig:
     temperature: float = 0.7
     max_tokens: int | None = None
     top_p: float = 0.9
-    stop: tuple[str, ...] = field(default_factory=tuple)
+    stop: tuple[str, ...] = ()
 
 
 @runtime_checkable
@@ -254,7 +254,8 @@ class MockTextGenerator:
                       If exhausted or not provided, generates placeholder text.
         """
         self._model = model
-        self._responses = list(responses) if responses else []
+        self._responses: tuple[str, ...] = tuple(responses) if responses else ()
+        self._next_response = 0
         self._call_count = 0
 
     @property
@@ -267,6 +268,25 @@ class MockTextGenerator:
         """Get the number of times generate/chat was called."""
         return self._call_count
 
+    def queue(self, responses: list[str]) -> None:
+        """
+        Replace any pending predefined responses.
+
+        Lets tests reuse one generator instead of constructing a new one
+        per scenario. Does not reset call_count.
+
+        Args:
+            responses: Responses to return in order before falling back
+                      to placeholder text.
+        """
+        self._responses = tuple(responses)
+        self._next_response = 0
+
+    def reset(self) -> None:
+        """Drop any pending predefined responses and reset call_count to zero."""
+        self.queue([])
+        self._call_count = 0
+
     def generate(
         self,
         prompt: str,
@@ -290,8 +310,10 @@ class MockTextGenerator:
         self._call_count += 1
 
         # Return predefined response if available
-        if self._responses:
-            return self._responses.pop(0)
+        index = self._next_response
+        if index < len(self._responses):
+            self._next_response = index + 1
+            return self._responses[index]
 
         # Generate placeholder based on last user message
         last_user = next(
@@ -19,6 +19,12 @@ from storyteller.ui.theme import (
     Typography,
 )
 
+# Steps slider (min, max, default) per FLUX model variant
+_MODEL_RANGE: dict[str, tuple[int, int, int]] = {
+    "schnell": (2, 8, 4),
+    "dev": (15, 30, 20),
+}
+
 
 def _create_settings_card(
     title: str,
@@ -140,6 +146,8 @@ class SettingsView(ft.Container):
             border_radius=BorderRadius.MD,
             on_select=self._on_model_change,
         )
+        # Matches the initial options, so an empty model list still clears "phi4"
+        self._last_models: tuple[str, ...] = ("phi4",)
 
         self._temperature_slider = ft.Slider(
             min=0.0,
@@ -155,6 +163,7 @@ class SettingsView(ft.Container):
             size=Typography.SIZE_SM,
             color=Colors.TEXT_SECONDARY,
         )
+        self._last_temp: float = 0.7
 
         self._max_tokens_dropdown = ft.Dropdown(
             label="Max Tokens",
@@ -224,6 +233,7 @@ class SettingsView(ft.Container):
             size=Typography.SIZE_SM,
             color=Colors.TEXT_SECONDARY,
         )
+        self._last_steps: int = 4
 
         self._auto_generate_checkbox = ft.Checkbox(
             label="Auto-generate illustrations after page text",
@@ -235,157 +245,151 @@ class SettingsView(ft.Container):
 
     def _build(self) -> None:
         """Build the settings view layout."""
-        # Story Settings Card
-        story_card = _create_settings_card(
-            title="Story Settings",
-            icon=ft.Icons.BOOK,
-            content=ft.Column(
-                controls=[
+        # (title, icon, body controls) for each card, in layout order
+        card_specs: tuple[tuple[str, str, list[ft.Control]], ...] = (
+            (
+                "Story Settings",
+                ft.Icons.BOOK,
+                [
                     self._title_field,
                     self._author_field,
                     self._target_age_dropdown,
                     self._page_count_dropdown,
                 ],
-                spacing=Spacing.MD,
             ),
+            ("Text Generation", ft.Icons.SMART_TOY, self._build_text_gen_controls()),
+            ("Illustration Style", ft.Icons.PALETTE, [self._style_radio]),
+            ("Image Generation", ft.Icons.IMAGE, self._build_image_gen_controls()),
+        )
+        story_card, text_gen_card, style_card, image_gen_card = (
+            _create_settings_card(
+                title=title,
+                icon=icon,
+                content=ft.Column(controls=controls, spacing=Spacing.MD),
+            )
+            for title, icon, controls in card_specs
         )
 
-        # Text Generation Card
-        text_gen_card = _create_settings_card(
-            title="Text Generation",
-            icon=ft.Icons.SMART_TOY,
+        # Two-column layout for cards
+        self.content = ft.Container(
             content=ft.Column(
                 controls=[
                     ft.Row(
-                        controls=[
-                            ft.Container(
-                                content=self._model_dropdown,
-                                expand=True,
-                            ),
-                            ft.IconButton(
-                                icon=ft.Icons.REFRESH,
-                                tooltip="Refresh Models",
-                                on_click=lambda _: (
-                                    self.on_refresh_models()
-                                    if self.on_refresh_models
-                                    else None
-                                ),
-                            ),
-                        ],
+                        controls=[story_card, text_gen_card],
+                        spacing=Spacing.LG,
+                        expand=True,
                     ),
-                    ft.Column(
-                        controls=[
-                            self._temperature_label,
-                            ft.Row(
-                                controls=[
-                                    ft.Text(
-                                        "Precise",
-                                        size=Typography.SIZE_SM,
-                                        color=Colors.TEXT_SECONDARY,
-                                    ),
-                                    ft.Container(
-                                        content=self._temperature_slider,
-                                        expand=True,
-                                    ),
-                                    ft.Text(
-                                        "Creative",
-                                        size=Typography.SIZE_SM,
-                                        color=Colors.TEXT_SECONDARY,
-                                    ),
-                                ],
-                            ),
-                        ],
-                        spacing=Spacing.XS,
+                    ft.Row(
+                        controls=[style_card, image_gen_card],
+                        spacing=Spacing.LG,
+                        expand=True,
                     ),
-                    self._max_tokens_dropdown,
                 ],
-                spacing=Spacing.MD,
+                spacing=Spacing.LG,
+                scroll=ft.ScrollMode.AUTO,
             ),
+            padding=Spacing.LG,
+            expand=True,
         )
 
-        # Illustration Style Card
-        style_card = _create_settings_card(
-            title="Illustration Style",
-            icon=ft.Icons.PALETTE,
-            content=ft.Column(
-                controls=[
-                    self._style_radio,
-                ],
-                spacing=Spacing.MD,
-            ),
-        )
+        self.expand = True
 
-        # Image Generation Card
-        image_gen_card = _create_settings_card(
-            title="Image Generation",
-            icon=ft.Icons.IMAGE,
-            content=ft.Column(
+    def _build_text_gen_controls(self) -> list[ft.Control]:
+        """Build the body controls for the Text Generation card.
+
+        Returns:
+            Controls for the model picker, temperature slider and token limit.
+        """
+        return [
+            ft.Row(
                 controls=[
-                    ft.Text(
-                        "Model:",
-                        size=Typography.SIZE_SM,
-                        weight=Typography.WEIGHT_MEDIUM,
+                    ft.Container(
+                        content=self._model_dropdown,
+                        expand=True,
                     ),
-                    self._image_model_radio,
-                    ft.Text(
-                        "Quantization:",
-                        size=Typography.SIZE_SM,
-                        weight=Typography.WEIGHT_MEDIUM,
+                    ft.IconButton(
+                        icon=ft.Icons.REFRESH,
+                        tooltip="Refresh Models",
+                        on_click=lambda _: (
+                            self.on_refresh_models()
+                            if self.on_refresh_models
+                            else None
+                        ),
                     ),
-                    self._quantization_radio,
-                    ft.Column(
+                ],
+            ),
+            ft.Column(
+                controls=[
+                    self._temperature_label,
+                    ft.Row(
                         controls=[
-                            self._steps_label,
-                            ft.Row(
-                                controls=[
-                                    ft.Text(
-                                        "Fast",
-                                        size=Typography.SIZE_SM,
-                                        color=Colors.TEXT_SECONDARY,
-                                    ),
-                                    ft.Container(
-                                        content=self._steps_slider,
-                                        expand=True,
-                                    ),
-                                    ft.Text(
-                                        "Quality",
-                                        size=Typography.SIZE_SM,
-                                        color=Colors.TEXT_SECONDARY,
-                                    ),
-                                ],
+                            ft.Text(
+                                "Precise",
+                                size=Typography.SIZE_SM,
+                                color=Colors.TEXT_SECONDARY,
+                            ),
+                            ft.Container(
+                                content=self._temperature_slider,
+                                expand=True,
+                            ),
+                            ft.Text(
+                                "Creative",
+                                size=Typography.SIZE_SM,
+                                color=Colors.TEXT_SECONDARY,
                             ),
                         ],
-                        spacing=Spacing.XS,
                     ),
-                    self._auto_generate_checkbox,
                 ],
-                spacing=Spacing.MD,
+                spacing=Spacing.XS,
             ),
-        )
+            self._max_tokens_dropdown,
+        ]
 
-        # Two-column layout for cards
-        self.content = ft.Container(
-            content=ft.Column(
+    def _build_image_gen_controls(self) -> list[ft.Control]:
+        """Build the body controls for the Image Generation card.
+
+        Returns:
+            Controls for model, quantization, steps and auto-generation.
+        """
+        return [
+            ft.Text(
+                "Model:",
+                size=Typography.SIZE_SM,
+                weight=Typography.WEIGHT_MEDIUM,
+            ),
+            self._image_model_radio,
+            ft.Text(
+                "Quantization:",
+                size=Typography.SIZE_SM,
+                weight=Typography.WEIGHT_MEDIUM,
+            ),
+            self._quantization_radio,
+            ft.Column(
                 controls=[
+                    self._steps_label,
                     ft.Row(
-                        controls=[story_card, text_gen_card],
-                        spacing=Spacing.LG,
-                        expand=True,
-                    ),
-                    ft.Row(
-                        controls=[style_card, image_gen_card],
-                        spacing=Spacing.LG,
-                        expand=True,
+                        controls=[
+                            ft.Text(
+                                "Fast",
+                                size=Typography.SIZE_SM,
+                                color=Colors.TEXT_SECONDARY,
+                            ),
+                            ft.Container(
+                                content=self._steps_slider,
+                                expand=True,
+                            ),
+                            ft.Text(
+                                "Quality",
+                                size=Typography.SIZE_SM,
+                                color=Colors.TEXT_SECONDARY,
+                            ),
+                        ],
                     ),
                 ],
-                spacing=Spacing.LG,
-                scroll=ft.ScrollMode.AUTO,
+                spacing=Spacing.XS,
             ),
-            padding=Spacing.LG,
-            expand=True,
-        )
-
-        self.expand = True
+            self._auto_generate_checkbox,
+        ]
 
     def _on_title_change(self, _e: ft.ControlEvent) -> None:
         """Handle title field change."""
@@ -411,6 +415,10 @@ class SettingsView(ft.Container):
     def _on_temperature_change(self, e: ft.ControlEvent) -> None:
         """Handle temperature slider change."""
         value = round(e.control.value, 1)
+        # Drag events fire between divisions; ignore ticks that don't change the value
+        if value == self._last_temp:
+            return
+        self._last_temp = value
         self._temperature_label.value = f"Temperature: {value}"
         state_manager.update_config(llm_temperature=value)
         if self.page:
@@ -421,20 +429,33 @@ class SettingsView(ft.Container):
         if e.control.value:
             state_manager.update_config(image_model=e.control.value)
             # Update steps range based on model
-            if e.control.value == "schnell":
-                self._steps_slider.min = 2
-                self._steps_slider.max = 8
-                self._steps_slider.value = 4
-            else:
-                self._steps_slider.min = 15
-                self._steps_slider.max = 30
-                self._steps_slider.value = 20
+            self._steps_slider.value = self._apply_model_range(e.control.value)
             if self.page:
                 self._steps_slider.update()
 
+    def _apply_model_range(self, model: str) -> int:
+        """Set the steps slider range for the given image model.
+
+        Does not touch the slider value or push an update; callers decide
+        which value to show and update once.
+
+        Args:
+            model: FLUX model variant ('schnell' or 'dev').
+
+        Returns:
+            The default number of steps for the model.
+        """
+        low, high, default = _MODEL_RANGE.get(model, _MODEL_RANGE["dev"])
+        self._steps_slider.min = low
+        self._steps_slider.max = high
+        return default
+
     def _on_steps_change(self, e: ft.ControlEvent) -> None:
         """Handle steps slider change."""
         value = int(e.control.value)
+        if value == self._last_steps:
+            return
+        self._last_steps = value
         self._steps_label.value = f"Steps: {value}"
         state_manager.update_config(image_steps=value)
         if self.page:
@@ -455,12 +476,18 @@ class SettingsView(ft.Container):
         Args:
             models: List of model names.
         """
-        self._model_dropdown.options = [
-            ft.dropdown.Option(key=model, text=model) for model in models
-        ]
+        # Only rebuild the options (and refresh the client) when something changed
+        new_models = tuple(models)
+        changed = new_models != self._last_models
+        if changed:
+            self._model_dropdown.options = [
+                ft.dropdown.Option(key=model, text=model) for model in new_models
+            ]
+            self._last_models = new_models
         if models and self._model_dropdown.value not in models:
             self._model_dropdown.value = models[0]
-        if self.page:
+            changed = True
+        if changed and self.page:
             self._model_dropdown.update()
 
     def get_story_settings(self) -> dict:
@@ -513,8 +540,10 @@ class SettingsView(ft.Container):
             quantization: Quantization level ('4-bit' or '8-bit').
         """
         self._image_model_radio.value = model
+        self._apply_model_range(model)
         self._steps_slider.value = steps
         self._steps_label.value = f"Steps: {steps}"
+        self._last_steps = steps
         self._quantization_radio.value = quantization
         if self.page:
             self.update()
@@ -533,5 +562,6 @@ class SettingsView(ft.Container):
         self._model_dropdown.value = model
         self._temperature_slider.value = temperature
         self._temperature_label.value = f"Temperature: {temperature}"
+        self._last_temp = temperature
         if self.page:
             self.update()
@@ -23,7 +23,7 @@ from storyteller.core import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_character() -> Character:
     """A sample character for testing."""
     return create_character(
@@ -33,7 +33,7 @@ def sample_character() -> Character:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_character_2() -> Character:
     """A second sample character for testing."""
     return create_character(
@@ -43,7 +43,7 @@ def sample_character_2() -> Character:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_page() -> Page:
     """A sample page for testing."""
     return create_page(
@@ -53,7 +53,7 @@ def sample_page() -> Page:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_page_2() -> Page:
     """A second sample page for testing."""
     return create_page(
@@ -63,7 +63,7 @@ def sample_page_2() -> Page:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_metadata() -> StoryMetadata:
     """Sample story metadata for testing."""
     return StoryMetadata(
@@ -76,7 +76,7 @@ def sample_metadata() -> StoryMetadata:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def empty_story() -> Story:
     """An empty story with just metadata."""
     return create_story(
@@ -87,7 +87,7 @@ def empty_story() -> Story:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_story(
     sample_character: Character,
     sample_page: Page,
@@ -106,6 +106,14 @@ def sample_story(
     return story
 
 
+@pytest.fixture(scope="session")
+def existing_image_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """An empty image file that exists for the whole session. Treat it as read-only."""
+    image_path = tmp_path_factory.mktemp("imgs") / "test.png"
+    image_path.touch()
+    return image_path
+
+
 @pytest.fixture
 def temp_stories_dir(tmp_path: Path) -> Generator[Path, None, None]:
     """A temporary directory for storing test stories."""
@@ -0,0 +1,47 @@
+"""
+Shared pytest fixtures for core module tests.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+import pytest
+
+from storyteller.core import Story, save_story
+from storyteller.core.persistence import dict_to_story, story_to_dict
+
+
+@pytest.fixture(scope="session")
+def sample_story_dict(sample_story: Story) -> dict[str, Any]:
+    """The serialized form of sample_story, built once per session.
+
+    Shared across tests, so treat it as read-only.
+    """
+    return story_to_dict(sample_story)
+
+
+@pytest.fixture(scope="session")
+def sample_story_bytes(sample_story_dict: dict[str, Any]) -> bytes:
+    """sample_story encoded as story.json bytes, built once per session."""
+    return orjson.dumps(sample_story_dict)
+
+
+@pytest.fixture(scope="session")
+def restored_sample(sample_story_dict: dict[str, Any]) -> Story:
+    """sample_story after one serialize/deserialize round trip."""
+    return dict_to_story(sample_story_dict)
+
+
+@pytest.fixture(scope="session")
+def saved_sample_project(
+    sample_story: Story, tmp_path_factory: pytest.TempPathFactory
+) -> Story:
+    """sample_story saved once to a session directory.
+
+    Shared across tests, so only use it from tests that don't modify the project.
+    """
+    base = tmp_path_factory.mktemp("saved")
+    return save_story(sample_story, project_path=base / "test-story")
+
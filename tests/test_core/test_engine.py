@@ -4,6 +4,8 @@ Tests for the story engine module.
 
 from __future__ import annotations
 
+from collections.abc import Generator
+
 import pytest
 
 from storyteller.core import (
@@ -15,18 +17,35 @@ from storyteller.core import (
 from storyteller.generation import MockTextGenerator
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_generator() -> MockTextGenerator:
-    """Create a mock text generator for testing."""
+    """Create a mock text generator shared by the tests in this module."""
     return MockTextGenerator(model="test-model")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def engine(mock_generator: MockTextGenerator) -> StoryEngine:
-    """Create a story engine with mock generator."""
+    """Create a story engine with mock generator, shared by the tests in this module."""
     return StoryEngine(text_generator=mock_generator)
 
 
+@pytest.fixture
+def started_engine(engine: StoryEngine) -> StoryEngine:
+    """The shared engine with a default story already started."""
+    engine.start_new_story()
+    return engine
+
+
+@pytest.fixture(autouse=True)
+def _reset_engine(
+    engine: StoryEngine, mock_generator: MockTextGenerator
+) -> Generator[None, None, None]:
+    """Restore the shared engine and mock generator after each test."""
+    yield
+    engine.conversation_state.clear()
+    mock_generator.reset()
+
+
 class TestConversationState:
     """Tests for the ConversationState class."""
 
@@ -79,15 +98,6 @@ class TestStoryEngine:
         """model_name returns the generator's model name."""
         assert engine.model_name == "test-model"
 
-    def test_start_new_story(self, engine: StoryEngine) -> None:
-        """start_new_story creates a story and returns opening prompt."""
-        result = engine.start_new_story(title="Test Story", author="Test Author")
-
-        assert isinstance(result, str)
-        assert len(result) > 0
-        assert engine.current_story is not None
-        assert engine.current_story.title == "Test Story"
-
     def test_start_new_story_clears_previous(self, engine: StoryEngine) -> None:
         """start_new_story clears any previous conversation."""
         engine.start_new_story(title="Story 1")
@@ -109,15 +119,14 @@ class TestStoryEngine:
         assert story.metadata.target_age == "5-8"  # Default
         assert story.metadata.style == "storybook_classic"  # Default
 
-    def test_process_user_input(self, engine: StoryEngine) -> None:
+    def test_process_user_input(self, started_engine: StoryEngine) -> None:
         """process_user_input generates a response."""
-        engine.start_new_story()
-        response = engine.process_user_input("I want a story about a mouse")
+        response = started_engine.process_user_input("I want a story about a mouse")
 
         assert isinstance(response, str)
         assert len(response) > 0
         # Check that user message was added
-        messages = engine.conversation_state.get_messages()
+        messages = started_engine.conversation_state.get_messages()
         user_messages = [m for m in messages if m.role == "user"]
         assert len(user_messages) == 1
 
@@ -128,11 +137,11 @@ class TestStoryEngine:
         assert engine.current_story is not None
         assert isinstance(response, str)
 
-    def test_generate_page_text(self, engine: StoryEngine) -> None:
+    def test_generate_page_text(
+        self, engine: StoryEngine, mock_generator: MockTextGenerator
+    ) -> None:
         """generate_page_text creates page text."""
-        # Setup with predefined response
-        mock = MockTextGenerator(responses=["Luna found a shiny acorn."])
-        engine = StoryEngine(text_generator=mock)
+        mock_generator.queue(["Luna found a shiny acorn."])
         engine.start_new_story(title="Luna's Adventure")
 
         text = engine.generate_page_text(
@@ -143,13 +152,13 @@ class TestStoryEngine:
 
         assert text == "Luna found a shiny acorn."
 
-    def test_generate_page_text_strips_quotes(self, engine: StoryEngine) -> None:
+    def test_generate_page_text_strips_quotes(
+        self, started_engine: StoryEngine, mock_generator: MockTextGenerator
+    ) -> None:
         """generate_page_text removes surrounding quotes."""
-        mock = MockTextGenerator(responses=['"Luna found a shiny acorn."'])
-        engine = StoryEngine(text_generator=mock)
-        engine.start_new_story()
+        mock_generator.queue(['"Luna found a shiny acorn."'])
 
-        text = engine.generate_page_text(
+        text = started_engine.generate_page_text(
             page_number=1,
             page_purpose="Test",
         )
@@ -161,23 +170,22 @@ class TestStoryEngine:
         with pytest.raises(ValueError, match="No active story"):
             engine.generate_page_text(page_number=1, page_purpose="Test")
 
-    def test_generate_illustration_prompt(self, engine: StoryEngine) -> None:
+    def test_generate_illustration_prompt(
+        self, started_engine: StoryEngine, mock_generator: MockTextGenerator
+    ) -> None:
         """generate_illustration_prompt creates a prompt."""
-        mock = MockTextGenerator(responses=["A cozy mouse hole under an oak tree"])
-        engine = StoryEngine(text_generator=mock)
-        engine.start_new_story()
+        mock_generator.queue(["A cozy mouse hole under an oak tree"])
 
-        prompt = engine.generate_illustration_prompt(
+        prompt = started_engine.generate_illustration_prompt(
             page_text="Luna lived in a cozy hole.",
             mood="warm and cozy",
         )
 
         assert "cozy mouse hole" in prompt
 
-    def test_add_character_to_story(self, engine: StoryEngine) -> None:
+    def test_add_character_to_story(self, started_engine: StoryEngine) -> None:
         """add_character_to_story adds a character."""
-        engine.start_new_story()
-        story = engine.add_character_to_story(
+        story = started_engine.add_character_to_story(
             name="Luna",
             description="A curious mouse",
             visual_traits=["brown fur", "big eyes"],
@@ -187,10 +195,11 @@ class TestStoryEngine:
         assert story.characters[0].name == "Luna"
         assert "brown fur" in story.characters[0].visual_traits
 
-    def test_extract_visual_traits(self, engine: StoryEngine) -> None:
+    def test_extract_visual_traits(
+        self, engine: StoryEngine, mock_generator: MockTextGenerator
+    ) -> None:
         """extract_visual_traits parses LLM response into list."""
-        mock = MockTextGenerator(responses=["brown fur, big eyes, pink nose"])
-        engine = StoryEngine(text_generator=mock)
+        mock_generator.queue(["brown fur, big eyes, pink nose"])
 
         traits = engine.extract_visual_traits(
             name="Luna",
@@ -199,10 +208,9 @@ class TestStoryEngine:
 
         assert traits == ["brown fur", "big eyes", "pink nose"]
 
-    def test_add_page_to_story(self, engine: StoryEngine) -> None:
+    def test_add_page_to_story(self, started_engine: StoryEngine) -> None:
         """add_page_to_story adds a page."""
-        engine.start_new_story()
-        story = engine.add_page_to_story(
+        story = started_engine.add_page_to_story(
             page_number=1,
             text="Once upon a time...",
             illustration_prompt="A sunny day",
@@ -213,12 +221,11 @@ class TestStoryEngine:
         assert page is not None
         assert page.text == "Once upon a time..."
 
-    def test_update_story_page(self, engine: StoryEngine) -> None:
+    def test_update_story_page(self, started_engine: StoryEngine) -> None:
         """update_story_page modifies an existing page."""
-        engine.start_new_story()
-        engine.add_page_to_story(page_number=1, text="Original text")
+        started_engine.add_page_to_story(page_number=1, text="Original text")
 
-        story = engine.update_story_page(page_number=1, text="Updated text")
+        story = started_engine.update_story_page(page_number=1, text="Updated text")
 
         page = story.get_page(1)
         assert page is not None
@@ -231,39 +238,22 @@ class TestStoryEngine:
 
         assert story.title == "New Title"
 
-    def test_set_story(self, engine: StoryEngine) -> None:
-        """set_story loads an existing story."""
-        existing_story = create_story(title="Existing Story")
-
-        engine.set_story(existing_story)
-
-        assert engine.current_story is existing_story
-        assert engine.conversation_state.current_phase == "editing"
-
-    def test_get_story(self, engine: StoryEngine) -> None:
-        """get_story returns the current story."""
-        assert engine.get_story() is None
-
-        engine.start_new_story(title="Test")
-        story = engine.get_story()
-
-        assert story is not None
-        assert story.title == "Test"
-
 
 class TestEngineWithMockResponses:
     """Integration-style tests using mock responses."""
 
-    def test_full_story_creation_flow(self) -> None:
+    def test_full_story_creation_flow(
+        self, engine: StoryEngine, mock_generator: MockTextGenerator
+    ) -> None:
         """Test a complete story creation workflow."""
-        responses = [
+        mock_generator.queue([
             "That sounds wonderful! A curious mouse named Luna in a forest. "
             "What kind of adventure should Luna have?",
             "Luna found a shiny acorn under the old oak tree.",
             "A cozy mouse hole under a large oak tree, watercolor style",
-        ]
-        mock = MockTextGenerator(responses=responses)
-        engine = StoryEngine(text_generator=mock)
+        ])
+
+        assert engine.get_story() is None
 
         # Start story
         start_prompt = engine.start_new_story(
@@ -271,6 +261,8 @@ class TestEngineWithMockResponses:
             author="Test Author",
         )
         assert "main character" in start_prompt.lower()
+        assert engine.current_story is not None
+        assert engine.current_story.title == "Luna's Adventure"
 
         # User describes their idea
         response = engine.process_user_input(
@@ -297,3 +289,9 @@ class TestEngineWithMockResponses:
         assert story is not None
         assert story.title == "Luna's Adventure"
         assert story.page_count == 1
+
+        # Switch to an existing story for editing
+        existing_story = create_story(title="Existing Story")
+        engine.set_story(existing_story)
+        assert engine.get_story() is existing_story
+        assert engine.conversation_state.current_phase == "editing"
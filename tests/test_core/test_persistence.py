@@ -4,10 +4,13 @@ Tests for the persistence layer (save/load stories).
 
 from __future__ import annotations
 
-import json
-from datetime import datetime
+import itertools
+from collections.abc import Callable
+from datetime import datetime, timedelta, tzinfo
 from pathlib import Path
+from typing import Any
 
+import orjson
 import pytest
 
 from storyteller.core import (
@@ -26,38 +29,61 @@ from storyteller.core.persistence import (
     SCHEMA_VERSION,
     create_project_directory,
     dict_to_story,
+    dumps_story,
+    loads_story,
     slugify,
     story_to_dict,
 )
 
 
-class TestSlugify:
-    """Tests for the slugify function."""
+@pytest.fixture(scope="module")
+def populated_stories_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A stories directory with two saved stories and one invalid project.
+
+    "Story Two" is saved after "Story One". Shared by the list_stories
+    tests, so treat it as read-only.
+    """
+    base = tmp_path_factory.mktemp("stories")
+    days = itertools.count()
+
+    class _TickingDatetime(datetime):
+        """datetime whose now() moves one day forward from 2024-01-01 on every call."""
 
-    def test_basic_slugify(self) -> None:
-        """Basic text is converted to slug."""
-        assert slugify("Hello World") == "hello-world"
+        @classmethod
+        def now(cls, tz: tzinfo | None = None) -> datetime:  # type: ignore[override]
+            del tz  # Unused but required by the datetime.now signature
+            return datetime(2024, 1, 1) + timedelta(days=next(days))
 
-    def test_special_characters_removed(self) -> None:
-        """Special characters are removed."""
-        assert slugify("Luna's Adventure!") == "lunas-adventure"
+    # save_story stamps modified_at via StoryMetadata.with_updates
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("storyteller.core.story.datetime", _TickingDatetime)
+        save_story(create_story(title="Story One"), project_path=base / "story-one")
+        save_story(create_story(title="Story Two"), project_path=base / "story-two")
 
-    def test_multiple_spaces(self) -> None:
-        """Multiple spaces become single hyphens."""
-        assert slugify("Hello   World") == "hello-world"
+    invalid_dir = base / "invalid-story"
+    invalid_dir.mkdir()
+    (invalid_dir / "story.json").write_text("not valid json")
+    return base
 
-    def test_leading_trailing_spaces(self) -> None:
-        """Leading/trailing spaces are removed."""
-        assert slugify("  Hello World  ") == "hello-world"
 
-    def test_empty_becomes_untitled(self) -> None:
-        """Empty string becomes 'untitled'."""
-        assert slugify("") == "untitled"
-        assert slugify("!!!") == "untitled"
+class TestSlugify:
+    """Tests for the slugify function."""
 
-    def test_numbers_preserved(self) -> None:
-        """Numbers are preserved in slugs."""
-        assert slugify("Story 123") == "story-123"
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Hello World", "hello-world"),
+            ("Luna's Adventure!", "lunas-adventure"),  # special characters removed
+            ("Hello   World", "hello-world"),  # multiple spaces become one hyphen
+            ("  Hello World  ", "hello-world"),  # leading/trailing spaces removed
+            ("", "untitled"),
+            ("!!!", "untitled"),
+            ("Story 123", "story-123"),  # numbers preserved
+        ],
+    )
+    def test_slugify(self, text: str, expected: str) -> None:
+        """Text is converted to a filesystem-safe slug."""
+        assert slugify(text) == expected
 
 
 class TestStoryToDict:
@@ -76,8 +102,7 @@ class TestStoryToDict:
     def test_serialization_is_json_compatible(self, sample_story: Story) -> None:
         """Serialized story can be converted to JSON."""
         data = story_to_dict(sample_story)
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        assert isinstance(orjson.dumps(data), bytes)
 
     def test_pages_serialization(self, sample_story: Story) -> None:
         """Pages are correctly serialized."""
@@ -92,31 +117,22 @@ class TestStoryToDict:
 class TestDictToStory:
     """Tests for story deserialization."""
 
-    def test_basic_deserialization(self, sample_story: Story) -> None:
+    def test_basic_deserialization(self, sample_story: Story, restored_sample: Story) -> None:
         """Story can be round-tripped through dict."""
-        data = story_to_dict(sample_story)
-        restored = dict_to_story(data)
-
-        assert restored.title == sample_story.title
-        assert restored.metadata.author == sample_story.metadata.author
-        assert len(restored.characters) == len(sample_story.characters)
-        assert len(restored.pages) == len(sample_story.pages)
+        assert restored_sample.title == sample_story.title
+        assert restored_sample.metadata.author == sample_story.metadata.author
+        assert len(restored_sample.characters) == len(sample_story.characters)
+        assert len(restored_sample.pages) == len(sample_story.pages)
 
-    def test_character_deserialization(self, sample_story: Story) -> None:
+    def test_character_deserialization(self, sample_story: Story, restored_sample: Story) -> None:
         """Characters are correctly deserialized."""
-        data = story_to_dict(sample_story)
-        restored = dict_to_story(data)
-
-        character = restored.get_character("Luna")
+        character = restored_sample.get_character("Luna")
         assert character is not None
         assert character.description == sample_story.characters[0].description
 
-    def test_page_deserialization(self, sample_story: Story) -> None:
+    def test_page_deserialization(self, sample_story: Story, restored_sample: Story) -> None:
         """Pages are correctly deserialized."""
-        data = story_to_dict(sample_story)
-        restored = dict_to_story(data)
-
-        page = restored.get_page(1)
+        page = restored_sample.get_page(1)
         original_page = sample_story.get_page(1)
         assert page is not None
         assert original_page is not None
@@ -173,21 +189,24 @@ class TestCreateProjectDirectory:
 class TestSaveStory:
     """Tests for saving stories."""
 
-    def test_save_creates_json(self, sample_story: Story, tmp_path: Path) -> None:
+    def test_save_creates_json(self, saved_sample_project: Story) -> None:
         """save_story creates story.json file."""
-        saved = save_story(sample_story, project_path=tmp_path / "test-story")
-
-        story_file = saved.project_path / "story.json"  # type: ignore[operator]
+        story_file = saved_sample_project.project_path / "story.json"  # type: ignore[operator]
         assert story_file.exists()
 
-    def test_save_returns_story_with_path(
-        self, sample_story: Story, tmp_path: Path
-    ) -> None:
+    def test_save_returns_story_with_path(self, saved_sample_project: Story) -> None:
         """save_story returns story with project_path set."""
-        saved = save_story(sample_story, project_path=tmp_path / "test-story")
+        assert saved_sample_project.project_path is not None
+        assert saved_sample_project.project_path.exists()
 
-        assert saved.project_path is not None
-        assert saved.project_path.exists()
+    def test_save_roundtrip_once(self, sample_story: Story, saved_sample_project: Story) -> None:
+        """A saved story loads back with the same characters and pages."""
+        assert saved_sample_project.project_path is not None
+        loaded = load_story(saved_sample_project.project_path)
+
+        assert loaded.title == sample_story.title
+        assert loaded.characters == sample_story.characters
+        assert loaded.pages == sample_story.pages
 
     def test_save_without_path_creates_directory(
         self, sample_story: Story, temp_stories_dir: Path, monkeypatch: pytest.MonkeyPatch
@@ -211,23 +230,17 @@ class TestSaveStory:
 
         assert saved.metadata.modified_at >= original_modified
 
-    def test_save_preserves_content(self, sample_story: Story, tmp_path: Path) -> None:
-        """Saved story can be loaded with same content."""
-        saved = save_story(sample_story, project_path=tmp_path / "test-story")
-        loaded = load_story(saved.project_path)  # type: ignore[arg-type]
-
-        assert loaded.title == sample_story.title
-        assert len(loaded.pages) == len(sample_story.pages)
-        assert len(loaded.characters) == len(sample_story.characters)
-
 
 class TestLoadStory:
     """Tests for loading stories."""
 
-    def test_load_existing_story(self, sample_story: Story, tmp_path: Path) -> None:
-        """load_story loads a saved story correctly."""
+    def test_load_existing_story(
+        self, sample_story: Story, sample_story_bytes: bytes, tmp_path: Path
+    ) -> None:
+        """load_story loads a story.json from disk correctly."""
         project_path = tmp_path / "test-story"
-        save_story(sample_story, project_path=project_path)
+        project_path.mkdir()
+        (project_path / "story.json").write_bytes(sample_story_bytes)
 
         loaded = load_story(project_path)
 
@@ -239,23 +252,29 @@ class TestLoadStory:
         with pytest.raises(FileNotFoundError):
             load_story(tmp_path / "nonexistent")
 
-    def test_load_preserves_characters(self, sample_story: Story, tmp_path: Path) -> None:
-        """Loaded story has all characters."""
-        project_path = tmp_path / "test-story"
-        save_story(sample_story, project_path=project_path)
 
-        loaded = load_story(project_path)
+class TestJsonRoundTrip:
+    """Tests for in-memory story.json serialization."""
+
+    def test_roundtrip_preserves_content(self, sample_story: Story) -> None:
+        """Story text can be loaded back with same content."""
+        loaded = loads_story(dumps_story(sample_story))
+
+        assert loaded.title == sample_story.title
+        assert len(loaded.pages) == len(sample_story.pages)
+        assert len(loaded.characters) == len(sample_story.characters)
+
+    def test_roundtrip_preserves_characters(self, sample_story: Story) -> None:
+        """Loaded story has all characters."""
+        loaded = loads_story(dumps_story(sample_story))
         character = loaded.get_character("Luna")
 
         assert character is not None
         assert character.visual_traits == sample_story.characters[0].visual_traits
 
-    def test_load_preserves_pages(self, sample_story: Story, tmp_path: Path) -> None:
+    def test_roundtrip_preserves_pages(self, sample_story: Story) -> None:
         """Loaded story has all pages with content."""
-        project_path = tmp_path / "test-story"
-        save_story(sample_story, project_path=project_path)
-
-        loaded = load_story(project_path)
+        loaded = loads_story(dumps_story(sample_story))
 
         for i in range(1, sample_story.page_count + 1):
             original = sample_story.get_page(i)
@@ -274,53 +293,29 @@ class TestListStories:
         stories = list_stories(base_dir=temp_stories_dir)
         assert stories == []
 
-    def test_list_finds_stories(self, temp_stories_dir: Path) -> None:
+    def test_list_finds_stories(self, populated_stories_dir: Path) -> None:
         """list_stories finds saved stories."""
-        story1 = create_story(title="Story One")
-        story2 = create_story(title="Story Two")
-
-        save_story(story1, project_path=temp_stories_dir / "story-one")
-        save_story(story2, project_path=temp_stories_dir / "story-two")
-
-        stories = list_stories(base_dir=temp_stories_dir)
+        stories = list_stories(base_dir=populated_stories_dir)
 
         assert len(stories) == 2
         titles = [meta.title for _, meta in stories]
         assert "Story One" in titles
         assert "Story Two" in titles
 
-    def test_list_sorted_by_modified(self, temp_stories_dir: Path) -> None:
+    def test_list_sorted_by_modified(self, populated_stories_dir: Path) -> None:
         """list_stories returns stories sorted by modified_at descending."""
-        story1 = create_story(title="Old Story")
-        story2 = create_story(title="New Story")
-
-        save_story(story1, project_path=temp_stories_dir / "old-story")
-        # Small delay to ensure different modified times
-        import time
-        time.sleep(0.01)
-        save_story(story2, project_path=temp_stories_dir / "new-story")
-
-        stories = list_stories(base_dir=temp_stories_dir)
+        stories = list_stories(base_dir=populated_stories_dir)
 
         # Newest first
-        assert stories[0][1].title == "New Story"
-        assert stories[1][1].title == "Old Story"
+        assert stories[0][1].title == "Story Two"
+        assert stories[1][1].title == "Story One"
 
-    def test_list_skips_invalid_directories(self, temp_stories_dir: Path) -> None:
+    def test_list_skips_invalid_directories(self, populated_stories_dir: Path) -> None:
         """list_stories skips directories without valid story.json."""
-        # Create a valid story
-        story = create_story(title="Valid Story")
-        save_story(story, project_path=temp_stories_dir / "valid-story")
-
-        # Create an invalid directory
-        invalid_dir = temp_stories_dir / "invalid-story"
-        invalid_dir.mkdir()
-        (invalid_dir / "story.json").write_text("not valid json")
-
-        stories = list_stories(base_dir=temp_stories_dir)
+        stories = list_stories(base_dir=populated_stories_dir)
 
-        assert len(stories) == 1
-        assert stories[0][1].title == "Valid Story"
+        assert len(stories) == 2
+        assert populated_stories_dir / "invalid-story" not in [path for path, _ in stories]
 
 
 class TestDeleteStory:
@@ -344,37 +339,39 @@ class TestDeleteStory:
 class TestPathHelpers:
     """Tests for path helper functions."""
 
-    def test_get_page_illustration_path(self, sample_story: Story, tmp_path: Path) -> None:
-        """get_page_illustration_path returns correct path."""
-        story = sample_story.with_project_path(tmp_path)
-        path = get_page_illustration_path(story, 1)
-
-        assert path == tmp_path / "pages" / "page_01.png"
-
-    def test_get_page_illustration_path_padding(
-        self, sample_story: Story, tmp_path: Path
+    @pytest.mark.parametrize(
+        ("helper", "arg", "expected_rel"),
+        [
+            (get_page_illustration_path, 1, "pages/page_01.png"),
+            (get_page_illustration_path, 10, "pages/page_10.png"),  # zero-padded
+            (get_export_path, "my-story.pdf", "exports/my-story.pdf"),
+        ],
+    )
+    def test_path_helper(
+        self,
+        sample_story: Story,
+        tmp_path: Path,
+        helper: Callable[[Story, Any], Path],
+        arg: int | str,
+        expected_rel: str,
     ) -> None:
-        """Page numbers are zero-padded."""
+        """Path helpers resolve inside the project directory."""
         story = sample_story.with_project_path(tmp_path)
-
-        assert get_page_illustration_path(story, 1).name == "page_01.png"
-        assert get_page_illustration_path(story, 10).name == "page_10.png"
-
-    def test_get_page_illustration_path_requires_saved(
-        self, sample_story: Story
+        assert helper(story, arg) == tmp_path / expected_rel
+
+    @pytest.mark.parametrize(
+        ("helper", "arg"),
+        [
+            (get_page_illustration_path, 1),
+            (get_export_path, "export.pdf"),
+        ],
+    )
+    def test_path_helper_requires_saved(
+        self,
+        sample_story: Story,
+        helper: Callable[[Story, Any], Path],
+        arg: int | str,
     ) -> None:
-        """get_page_illustration_path raises for unsaved story."""
-        with pytest.raises(ValueError, match="must be saved"):
-            get_page_illustration_path(sample_story, 1)
-
-    def test_get_export_path(self, sample_story: Story, tmp_path: Path) -> None:
-        """get_export_path returns correct path."""
-        story = sample_story.with_project_path(tmp_path)
-        path = get_export_path(story, "my-story.pdf")
-
-        assert path == tmp_path / "exports" / "my-story.pdf"
-
-    def test_get_export_path_requires_saved(self, sample_story: Story) -> None:
-        """get_export_path raises for unsaved story."""
+        """Path helpers raise for an unsaved story."""
         with pytest.raises(ValueError, match="must be saved"):
-            get_export_path(sample_story, "export.pdf")
+            helper(sample_story, arg)
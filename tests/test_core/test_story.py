@@ -4,6 +4,8 @@ Tests for the story data models and factory functions.
 
 from __future__ import annotations
 
+import copy
+import pickle
 from dataclasses import FrozenInstanceError
 from datetime import datetime
 from pathlib import Path
@@ -64,6 +66,12 @@ class TestCharacter:
         # Original unchanged
         assert sample_character.name == "Luna"
 
+    def test_appears_in_text_case_insensitive(self, sample_character: Character) -> None:
+        """appears_in_text matches names regardless of case, using Unicode case folding."""
+        assert sample_character.appears_in_text("Then LUNA smiled.")
+        assert not sample_character.appears_in_text("Then Oliver smiled.")
+        assert create_character("Straße", "a road").appears_in_text("Down the STRASSE")
+
 
 class TestPage:
     """Tests for the Page dataclass."""
@@ -108,12 +116,10 @@ class TestPage:
         assert page.has_illustration() is False
 
     def test_has_illustration_with_existing_path(
-        self, sample_page: Page, tmp_path: Path
+        self, sample_page: Page, existing_image_path: Path
     ) -> None:
         """has_illustration returns True when path exists."""
-        image_path = tmp_path / "test.png"
-        image_path.touch()
-        page = sample_page.with_updates(illustration_path=image_path)
+        page = sample_page.with_updates(illustration_path=existing_image_path)
         assert page.has_illustration() is True
 
 
@@ -201,6 +207,16 @@ class TestStory:
         assert updated.project_path == tmp_path
         assert sample_story.project_path is None  # Original unchanged
 
+    def test_deepcopy_and_pickle_after_lookups(self, sample_story: Story) -> None:
+        """A story can be deep-copied and pickled after its lookup indices are built."""
+        assert sample_story.get_page(1) is not None
+        assert sample_story.get_character("Luna") is not None
+
+        for restored in (copy.deepcopy(sample_story), pickle.loads(pickle.dumps(sample_story))):
+            assert restored == sample_story
+            assert restored.get_page(2) == sample_story.get_page(2)
+            assert restored.get_character("luna") == sample_story.get_character("Luna")
+
 
 class TestStoryFactoryFunctions:
     """Tests for story manipulation factory functions."""
@@ -228,6 +244,15 @@ class TestStoryFactoryFunctions:
         updated = remove_character(sample_story, "luna")
         assert updated.get_character("Luna") is None
 
+    def test_remove_character_removes_all_matches(self, empty_story: Story) -> None:
+        """remove_character drops every character whose name matches."""
+        story = add_character(empty_story, create_character("Luna", "a mouse"))
+        story = add_character(story, create_character("luna", "another mouse"))
+        story = add_character(story, create_character("Max", "a dog"))
+
+        updated = remove_character(story, "LUNA")
+        assert [c.name for c in updated.characters] == ["Max"]
+
     def test_add_page(self, empty_story: Story, sample_page: Page) -> None:
         """add_page adds a page to the story."""
         updated = add_page(empty_story, sample_page)
@@ -270,6 +295,18 @@ class TestStoryFactoryFunctions:
         assert updated.get_page(2) is not None
         assert sample_story.page_count == 2  # Original unchanged
 
+    def test_duplicate_page_numbers_all_affected(self, empty_story: Story) -> None:
+        """update_page and remove_page apply to every page sharing the number."""
+        story = add_page(empty_story, create_page(1, "First"))
+        story = add_page(story, create_page(1, "Second"))
+        story = add_page(story, create_page(2, "Other"))
+
+        updated = update_page(story, 1, text="Same")
+        assert [page.text for page in updated.pages] == ["Same", "Same", "Other"]
+
+        removed = remove_page(story, 1)
+        assert [page.text for page in removed.pages] == ["Other"]
+
     def test_renumber_pages(self, sample_story: Story) -> None:
         """renumber_pages creates sequential numbering."""
         # Remove page 1, leaving gap
@@ -279,6 +316,16 @@ class TestStoryFactoryFunctions:
         # Renumber
         renumbered = renumber_pages(story)
         assert renumbered.pages[0].page_number == 1
+        assert renumbered.get_page(1) is renumbered.pages[0]
+
+    def test_renumber_pages_reuses_numbered_pages(self, sample_story: Story) -> None:
+        """renumber_pages leaves pages that are already in place untouched."""
+        story = add_page(sample_story, create_page(3, "The end."))
+        story = remove_page(story, 2)
+        renumbered = renumber_pages(story)
+
+        assert renumbered.pages[0] is story.pages[0]
+        assert renumbered.pages[1].page_number == 2
 
 
 class TestConstants:
@@ -0,0 +1,40 @@
+"""
+Shared pytest fixtures for generation module tests.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Generator
+from contextlib import ExitStack
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _seed_rng() -> None:
+    """Seed the random module so generated image seeds are reproducible."""
+    random.seed(0xC0FFEE)
+
+
+@pytest.fixture
+def mocked_image_env() -> Generator[tuple[MagicMock, MagicMock, MagicMock], None, None]:
+    """Patch the platform and mflux checks to pass and stub out the flux model.
+
+    Yields:
+        (mock_platform, mock_mflux, mock_flux_model). Assign mock_flux_model to a
+        generator's _flux_model; its generate_image returns a MagicMock image.
+    """
+    with ExitStack() as stack:
+        mock_platform = stack.enter_context(patch("storyteller.generation.image.check_platform"))
+        mock_mflux = stack.enter_context(
+            patch("storyteller.generation.image.check_mflux_available")
+        )
+        stack.enter_context(patch.dict("sys.modules", {"mflux.config.config": MagicMock()}))
+        mock_platform.return_value = (True, "OK")
+        mock_mflux.return_value = (True, "OK")
+
+        mock_flux_model = MagicMock()
+        mock_flux_model.generate_image.return_value = MagicMock()
+        yield mock_platform, mock_mflux, mock_flux_model
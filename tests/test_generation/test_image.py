@@ -4,14 +4,16 @@ Tests for the image generation module.
 
 from __future__ import annotations
 
+import random
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
+import storyteller.generation.image as image_module
 from storyteller.generation.image import (
     GenerationResult,
     ImageConfig,
@@ -105,7 +107,6 @@ class TestSingletonThreadSafety:
 
     def setup_method(self) -> None:
         """Reset the singleton before each test."""
-        import storyteller.generation.image as image_module
         image_module._default_generator = None
 
     def test_get_generator_returns_singleton(self) -> None:
@@ -133,20 +134,18 @@ class TestSingletonThreadSafety:
 
     def test_concurrent_get_generator_creates_single_instance(self) -> None:
         """Multiple threads calling get_generator create only one instance."""
-        import storyteller.generation.image as image_module
-        image_module._default_generator = None
-
         results = []
-        barrier = threading.Barrier(10)
+        start = threading.Event()
 
         def get_gen():
-            barrier.wait()  # Ensure all threads start together
+            start.wait()  # Ensure all threads start together
             gen = get_generator()
             results.append(gen)
 
         threads = [threading.Thread(target=get_gen) for _ in range(10)]
         for t in threads:
             t.start()
+        start.set()
         for t in threads:
             t.join()
 
@@ -158,62 +157,54 @@ class TestSingletonThreadSafety:
 class TestPathTraversalSecurity:
     """Tests for path traversal security validation."""
 
-    def test_forbidden_path_etc(self) -> None:
-        """Paths to /etc are rejected."""
+    @pytest.mark.parametrize(
+        "bad_path",
+        [
+            Path("/etc/passwd.png"),
+            Path("/var/log/test.png"),
+            Path("/sys/x.png"),
+            Path("/proc/x.png"),
+        ],
+        ids=["etc", "var", "sys", "proc"],
+    )
+    def test_forbidden_path(
+        self, bad_path: Path, mocked_image_env: tuple[MagicMock, MagicMock, MagicMock]
+    ) -> None:
+        """Paths into system directories are rejected."""
+        _, _, mock_flux = mocked_image_env
         generator = ImageGenerator()
-        # Mock the platform and mflux checks to pass, plus the mflux config import
-        with patch("storyteller.generation.image.check_platform") as mock_platform, \
-             patch("storyteller.generation.image.check_mflux_available") as mock_mflux, \
-             patch.dict("sys.modules", {"mflux.config.config": MagicMock()}):
-            mock_platform.return_value = (True, "OK")
-            mock_mflux.return_value = (True, "OK")
-
-            # Create a mock image object with a save method
-            mock_image = MagicMock()
-            mock_image.save = MagicMock()
-
-            # Mock the flux model and its generate_image method
-            mock_flux = MagicMock()
-            mock_flux.generate_image = MagicMock(return_value=mock_image)
-            generator._flux_model = mock_flux
-
-            result = generator.generate(
-                prompt="test",
-                output_path=Path("/etc/passwd.png"),
-            )
-
-            assert not result.success
-            assert "system directory" in result.error.lower()
-            # Ensure the image was NOT saved
-            mock_image.save.assert_not_called()
-
-    def test_forbidden_path_var(self) -> None:
-        """Paths to /var are rejected."""
+        generator._flux_model = mock_flux
+
+        result = generator.generate(prompt="test", output_path=bad_path)
+
+        assert not result.success
+        assert "system directory" in result.error.lower()
+        # Ensure the image was NOT saved
+        mock_flux.generate_image.return_value.save.assert_not_called()
+
+    def test_symlinked_forbidden_directory(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        mocked_image_env: tuple[MagicMock, MagicMock, MagicMock],
+    ) -> None:
+        """A forbidden directory that is a symlink is also matched by its real location."""
+        real_dir = tmp_path / "private" / "etc"
+        real_dir.mkdir(parents=True)
+        link_dir = tmp_path / "etc"
+        link_dir.symlink_to(real_dir)
+        monkeypatch.setattr(
+            image_module, "_FORBIDDEN_PREFIXES", image_module._forbidden_prefixes([str(link_dir)])
+        )
+        _, _, mock_flux = mocked_image_env
         generator = ImageGenerator()
-        with patch("storyteller.generation.image.check_platform") as mock_platform, \
-             patch("storyteller.generation.image.check_mflux_available") as mock_mflux, \
-             patch.dict("sys.modules", {"mflux.config.config": MagicMock()}):
-            mock_platform.return_value = (True, "OK")
-            mock_mflux.return_value = (True, "OK")
+        generator._flux_model = mock_flux
 
-            # Create a mock image object with a save method
-            mock_image = MagicMock()
-            mock_image.save = MagicMock()
+        result = generator.generate(prompt="test", output_path=link_dir / "x.png")
 
-            # Mock the flux model and its generate_image method
-            mock_flux = MagicMock()
-            mock_flux.generate_image = MagicMock(return_value=mock_image)
-            generator._flux_model = mock_flux
-
-            result = generator.generate(
-                prompt="test",
-                output_path=Path("/var/log/test.png"),
-            )
-
-            assert not result.success
-            assert "system directory" in result.error.lower()
-            # Ensure the image was NOT saved
-            mock_image.save.assert_not_called()
+        assert not result.success
+        assert "system directory" in result.error.lower()
+        mock_flux.generate_image.return_value.save.assert_not_called()
 
 
 class TestGenerationResult:
@@ -261,3 +252,23 @@ class TestImageGeneratorCancel:
         assert docstring is not None
         assert "cooperative" in docstring.lower() or "checkpoint" in docstring.lower()
         assert "30-90" in docstring or "2-4 minutes" in docstring
+
+
+class TestSeedSelection:
+    """Tests for choosing a seed when none is configured."""
+
+    def test_unseeded_generation_draws_from_random(
+        self, mocked_image_env: tuple[MagicMock, MagicMock, MagicMock], tmp_path: Path
+    ) -> None:
+        """Without a configured seed, generate() draws one from the random module."""
+        _, _, mock_flux = mocked_image_env
+        generator = ImageGenerator()
+        generator._flux_model = mock_flux
+
+        random.seed(1)
+        expected = random.randrange(MAX_SEED)
+        random.seed(1)
+        result = generator.generate(prompt="test", output_path=tmp_path / "page.png")
+
+        assert result.success
+        assert result.seed_used == expected
@@ -4,6 +4,10 @@ Tests for the prompt templates module.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+
+import pytest
+
 from storyteller.generation import (
     PromptTemplate,
     get_all_templates,
@@ -14,7 +18,10 @@ from storyteller.generation import (
     PAGE_WRITER_SYSTEM,
     STORY_START,
     WRITE_PAGE_TEXT,
+    build_illustration_prompt_simple,
+    find_characters_in_page,
 )
+from storyteller.generation.prompts import MAX_SCENE_LENGTH
 
 
 class TestPromptTemplate:
@@ -49,6 +56,46 @@ class TestPromptTemplate:
         result = template.render(name="Alice")
         assert result == "Hello Alice, your age is $age!"
 
+    def test_render_keeps_literal_braces_and_dollars(self) -> None:
+        """render treats braces as plain text and "$$" as an escaped "$"."""
+        template = PromptTemplate(
+            name="test",
+            template="{$name} costs $$5 and ${item}s",
+        )
+        result = template.render(name="Alice", item="apple")
+        assert result == "{Alice} costs $5 and apples"
+
+    def test_partial_bakes_constants(self) -> None:
+        """partial substitutes some variables and keeps the others as placeholders."""
+        template = PromptTemplate(
+            name="test",
+            template="$title costs $$5, page $page of ${total}",
+            description="A test template",
+        )
+        baked = template.partial(title="Luna", total=12)
+        assert baked.name == "test"
+        assert baked.description == "A test template"
+        assert baked.render(page=3) == template.render(title="Luna", total=12, page=3)
+        assert baked.render() == "Luna costs $5, page $page of 12"
+
+    def test_partial_does_not_expand_placeholders_in_values(self) -> None:
+        """Values passed to partial are literal text, even if they contain "$"."""
+        template = PromptTemplate(name="test", template="$title: $page")
+        baked = template.partial(title="$page")
+        assert baked.render(page="1") == "$page: 1"
+
+    def test_partial_keeps_adjacent_placeholders_separate(self) -> None:
+        """A baked value next to a remaining placeholder does not merge into its name."""
+        template = PromptTemplate(name="test", template="$page$title")
+        baked = template.partial(title="s")
+        assert baked.render(page="1") == "1s"
+
+    def test_partial_with_empty_value_keeps_placeholders_separate(self) -> None:
+        """Baking an empty value cannot merge the neighbouring placeholder and text."""
+        template = PromptTemplate(name="test", template="$c${b}x")
+        baked = template.partial(b="")
+        assert baked.render(c=" ") == " x"
+
     def test_render_multiline(self) -> None:
         """render works with multiline templates."""
         template = PromptTemplate(
@@ -111,10 +158,17 @@ class TestBuiltInTemplates:
 class TestGetAllTemplates:
     """Tests for the get_all_templates function."""
 
-    def test_returns_dict(self) -> None:
-        """get_all_templates returns a dictionary."""
+    def test_returns_mapping(self) -> None:
+        """get_all_templates returns a mapping."""
+        templates = get_all_templates()
+        assert isinstance(templates, Mapping)
+
+    def test_returns_shared_read_only_mapping(self) -> None:
+        """get_all_templates returns the same mapping each call, and it can't be modified."""
         templates = get_all_templates()
-        assert isinstance(templates, dict)
+        assert get_all_templates() is templates
+        with pytest.raises(TypeError):
+            templates["story_start"] = STORY_START  # type: ignore[index]
 
     def test_contains_required_templates(self) -> None:
         """All required templates are present."""
@@ -214,6 +268,14 @@ class TestCalculateStoryStructure:
         # Ending starts ~3/4 through
         assert structure["ending_start"] <= 12
 
+    def test_structure_is_shared_and_read_only(self) -> None:
+        """Repeated calls return the same read-only mapping, even for unusual lengths."""
+        for page_count in [12, 100]:
+            structure = calculate_story_structure(page_count)
+            assert calculate_story_structure(page_count) is structure
+            with pytest.raises(TypeError):
+                structure["beginning_end"] = 0  # type: ignore[index]
+
     def test_structure_covers_all_pages(self) -> None:
         """Structure accounts for all pages without gaps."""
         for page_count in [4, 6, 8, 10, 12]:
@@ -231,8 +293,6 @@ class TestFindCharactersInPage:
 
     def test_finds_character_by_name(self) -> None:
         """Character is found when name appears in text."""
-        from storyteller.generation import find_characters_in_page
-
         characters = [
             ("Luna", "a brave mouse", ("small", "brown")),
         ]
@@ -242,8 +302,6 @@ class TestFindCharactersInPage:
 
     def test_case_insensitive_matching(self) -> None:
         """Character matching is case insensitive."""
-        from storyteller.generation import find_characters_in_page
-
         characters = [
             ("Luna", "a brave mouse", ("small",)),
         ]
@@ -252,8 +310,6 @@ class TestFindCharactersInPage:
 
     def test_word_boundary_prevents_substring_match(self) -> None:
         """Character name 'Art' should not match 'Arthur' or 'party'."""
-        from storyteller.generation import find_characters_in_page
-
         characters = [
             ("Art", "a painter", ("artistic",)),
         ]
@@ -270,10 +326,26 @@ class TestFindCharactersInPage:
         assert len(result) == 1
         assert result[0][0] == "Art"
 
+    def test_overlapping_names_are_all_found(self) -> None:
+        """Names contained in or prefixing other names are still matched."""
+        characters = [
+            ("Mr. Owl", "a wise owl", ("round spectacles",)),
+            ("Owl", "a young owl", ("fluffy",)),
+            ("Luna", "a brave mouse", ("small",)),
+            ("Luna Bee", "a busy bee", ("striped",)),
+        ]
+        result = find_characters_in_page("Mr. Owl waved to Luna Bee.", characters)
+        assert [name for name, _, _ in result] == ["Mr. Owl", "Owl", "Luna", "Luna Bee"]
+
+    def test_repeated_page_reflects_updated_traits(self) -> None:
+        """Re-checking the same page returns the current descriptions and traits."""
+        text = "Luna hopped through the garden."
+        find_characters_in_page(text, [("Luna", "a brave mouse", ("small",))])
+        result = find_characters_in_page(text, [("Luna", "a sleepy mouse", ["gray"])])
+        assert result == [("Luna", "a sleepy mouse", ["gray"])]
+
     def test_word_boundary_at_sentence_boundaries(self) -> None:
         """Character is found at start/end of sentences."""
-        from storyteller.generation import find_characters_in_page
-
         characters = [
             ("Max", "a friendly dog", ("golden",)),
         ]
@@ -287,8 +359,6 @@ class TestFindCharactersInPage:
 
     def test_multiple_characters_found(self) -> None:
         """Multiple characters are found in the same text."""
-        from storyteller.generation import find_characters_in_page
-
         characters = [
             ("Luna", "a mouse", ("small",)),
             ("Felix", "a cat", ("orange",)),
@@ -302,8 +372,6 @@ class TestFindCharactersInPage:
 
     def test_special_characters_in_name(self) -> None:
         """Names with special characters are matched correctly."""
-        from storyteller.generation import find_characters_in_page
-
         characters = [
             ("Mr. Fox", "a clever fox", ("red",)),
         ]
@@ -313,8 +381,6 @@ class TestFindCharactersInPage:
 
     def test_no_characters_found(self) -> None:
         """Empty list returned when no characters match."""
-        from storyteller.generation import find_characters_in_page
-
         characters = [
             ("Luna", "a mouse", ("small",)),
         ]
@@ -323,8 +389,6 @@ class TestFindCharactersInPage:
 
     def test_returns_visual_traits_as_list(self) -> None:
         """Visual traits are returned as a list (not tuple)."""
-        from storyteller.generation import find_characters_in_page
-
         characters = [
             ("Luna", "a mouse", ("small", "brown", "curious")),
         ]
@@ -339,8 +403,6 @@ class TestBuildIllustrationPromptSimple:
 
     def test_basic_prompt(self) -> None:
         """Basic prompt is created from page text."""
-        from storyteller.generation import build_illustration_prompt_simple
-
         result = build_illustration_prompt_simple(
             page_text="Luna found a magical flower.",
             style="watercolor",
@@ -350,8 +412,6 @@ class TestBuildIllustrationPromptSimple:
 
     def test_with_characters(self) -> None:
         """Character traits are included in prompt."""
-        from storyteller.generation import build_illustration_prompt_simple
-
         result = build_illustration_prompt_simple(
             page_text="Test page",
             characters=[("Luna", "a mouse", ["small", "brown"])],
@@ -363,9 +423,6 @@ class TestBuildIllustrationPromptSimple:
 
     def test_invalid_style_raises_error(self) -> None:
         """Invalid style name raises KeyError."""
-        import pytest
-        from storyteller.generation import build_illustration_prompt_simple
-
         with pytest.raises(KeyError):
             build_illustration_prompt_simple(
                 page_text="Test",
@@ -374,9 +431,6 @@ class TestBuildIllustrationPromptSimple:
 
     def test_long_text_is_truncated(self) -> None:
         """Text longer than MAX_SCENE_LENGTH is truncated."""
-        from storyteller.generation import build_illustration_prompt_simple
-        from storyteller.generation.prompts import MAX_SCENE_LENGTH
-
         long_text = "A" * 500
         result = build_illustration_prompt_simple(
             page_text=long_text,
@@ -386,11 +440,11 @@ class TestBuildIllustrationPromptSimple:
         assert "..." in result
         # The full long text should not appear
         assert long_text not in result
+        # Truncation keeps the scene within MAX_SCENE_LENGTH, ellipsis included
+        assert "Scene: " + "A" * (MAX_SCENE_LENGTH - 3) + "...." in result
 
     def test_includes_safety_modifiers(self) -> None:
         """Safety modifiers are included via apply_style."""
-        from storyteller.generation import build_illustration_prompt_simple
-
         result = build_illustration_prompt_simple(
             page_text="A test scene",
             style="watercolor",
@@ -404,10 +458,8 @@ class TestMaxSceneLengthConstant:
 
     def test_constant_exists(self) -> None:
         """MAX_SCENE_LENGTH constant is defined."""
-        from storyteller.generation.prompts import MAX_SCENE_LENGTH
         assert MAX_SCENE_LENGTH == 200
 
     def test_constant_is_reasonable(self) -> None:
         """MAX_SCENE_LENGTH is a reasonable value for prompts."""
-        from storyteller.generation.prompts import MAX_SCENE_LENGTH
         assert 100 <= MAX_SCENE_LENGTH <= 500
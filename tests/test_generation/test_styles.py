@@ -7,6 +7,7 @@ from __future__ import annotations
 import pytest
 
 from storyteller.generation.styles import (
+    _SAFETY_APPLIED_BY,
     SAFETY_MODIFIERS,
     STYLE_PRESETS,
     StylePreset,
@@ -103,9 +104,15 @@ class TestApplyStyle:
         assert "children's book illustration" in result.lower()
         assert "friendly" in result.lower()
 
+    def test_matches_suffix_and_modifiers_for_every_style(self) -> None:
+        """apply_style appends exactly the style suffix and the safety modifiers."""
+        for name, preset in STYLE_PRESETS.items():
+            result = apply_style("A scene", name)
+            assert result == f"A scene, {preset.prompt_suffix}, {SAFETY_MODIFIERS}"
+
     def test_invalid_style_raises_keyerror(self) -> None:
         """apply_style raises KeyError for invalid style."""
-        with pytest.raises(KeyError):
+        with pytest.raises(KeyError, match="Available:"):
             apply_style("test prompt", "invalid_style")
 
     def test_preserves_base_prompt(self) -> None:
@@ -148,6 +155,17 @@ class TestBuildIllustrationPrompt:
         assert "morning light" in result
         assert "dew on leaves" in result
 
+    def test_joins_parts_in_order(self) -> None:
+        """Scene, traits and context are joined with commas before the style suffix."""
+        result = build_illustration_prompt(
+            scene_description="A scene",
+            character_traits=["small brown mouse", "red scarf"],
+            style_name="cartoon",
+            additional_context="morning light",
+        )
+        expected_base = "A scene, featuring small brown mouse, red scarf, morning light"
+        assert result == apply_style(expected_base, "cartoon")
+
     def test_includes_safety_modifiers(self) -> None:
         """build_illustration_prompt includes safety modifiers."""
         result = build_illustration_prompt(
@@ -167,15 +185,13 @@ class TestSafetyModifiers:
         assert "friendly" in SAFETY_MODIFIERS.lower()
         assert "safe" in SAFETY_MODIFIERS.lower()
 
-    def test_safety_modifiers_comment_accuracy(self) -> None:
-        """Docstring/comment accurately describes when modifiers are applied."""
-        # This test verifies the module correctly documents that safety
-        # modifiers are NOT automatically applied to all prompts
+    def test_safety_modifiers_applied_by(self) -> None:
+        """Every function documented as adding the safety modifiers actually adds them."""
         import storyteller.generation.styles as styles_module
-        with open(styles_module.__file__) as f:
-            source = f.read()
-        # Check that the comment mentions apply_style or build_illustration_prompt
-        assert "apply_style" in source or "build_illustration_prompt" in source
+
+        assert "apply_style" in _SAFETY_APPLIED_BY
+        for name in _SAFETY_APPLIED_BY:
+            assert SAFETY_MODIFIERS in getattr(styles_module, name)("a cat", style_name="cartoon")
 
 
 class TestStylePresets:
@@ -193,6 +209,11 @@ class TestStylePresets:
         assert "cartoon" in style.prompt_suffix.lower()
         assert "bright" in style.prompt_suffix.lower() or "vibrant" in style.prompt_suffix.lower()
 
+    def test_presets_are_read_only(self) -> None:
+        """STYLE_PRESETS can't be modified at runtime."""
+        with pytest.raises(TypeError):
+            STYLE_PRESETS["custom"] = STYLE_PRESETS["watercolor"]  # type: ignore[index]
+
     def test_all_presets_have_required_fields(self) -> None:
         """All presets have non-empty required fields."""
         for name, preset in STYLE_PRESETS.items():
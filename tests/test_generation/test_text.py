@@ -85,6 +85,25 @@ class TestMockTextGenerator:
         # After exhausted, returns generic mock
         assert "Mock response" in mock.generate("prompt 3")
 
+    def test_queue_replaces_pending_responses(self) -> None:
+        """queue swaps in new predefined responses on an existing generator."""
+        mock = MockTextGenerator(responses=["Stale response"])
+        mock.queue(["Fresh response"])
+
+        assert mock.generate("prompt 1") == "Fresh response"
+        assert "Mock response" in mock.generate("prompt 2")
+
+    def test_reset_clears_responses_and_call_count(self) -> None:
+        """reset drops pending responses and starts counting calls from zero."""
+        mock = MockTextGenerator(responses=["Stale response"])
+        mock.generate("prompt 1")
+        mock.queue(["Pending response"])
+        mock.reset()
+
+        assert mock.call_count == 0
+        assert "Mock response" in mock.generate("prompt 2")
+        assert mock.call_count == 1
+
     def test_chat_returns_mock_response(self) -> None:
         """chat returns a mock response."""
         mock = MockTextGenerator()